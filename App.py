@@ -1,11 +1,9 @@
 
 import streamlit as st
-from PIL import Image
 import io
 import json
 from datetime import datetime
-import pytesseract
-import re
+from resources import load_ocr_engine, load_rules, start_warm_up
 
 # Set page config FIRST
 st.set_page_config(
@@ -15,8 +13,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Tesseract configuration
-pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+# Detect Tesseract and compile rules in the background while the page renders
+start_warm_up()
 
 # Custom CSS for better UI
 st.markdown("""
@@ -43,32 +41,6 @@ st.markdown("""
         box-shadow: 0 4px 12px rgba(255,107,107,0.3);
     }
     
-    .safe-dish {
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        border-left: 5px solid #28a745;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-    }
-    
-    .unsafe-dish {
-        background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        border-left: 5px solid #dc3545;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-    }
-    
-    .metric-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 2px 12px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    
     h1 {
         color: #2C3E50;
         font-size: 2.5rem !important;
@@ -76,12 +48,6 @@ st.markdown("""
         margin-bottom: 0.5rem !important;
     }
     
-    .subtitle {
-        color: #7F8C8D;
-        font-size: 1.2rem;
-        margin-bottom: 2rem;
-    }
-    
     @keyframes pulse {
         0%, 100% { transform: scale(1); opacity: 1; }
         50% { transform: scale(1.1); opacity: 0.8; }
@@ -96,6 +62,12 @@ if 'results' not in st.session_state:
     st.session_state.results = None
 if 'extracted_text' not in st.session_state:
     st.session_state.extracted_text = None
+if 'scanner' not in st.session_state:
+    st.session_state.scanner = None
+if 'last_frame_id' not in st.session_state:
+    st.session_state.last_frame_id = None
+if 'scan_mode' not in st.session_state:
+    st.session_state.scan_mode = None
 
 # Function to analyze dishes based on dietary restrictions
 def analyze_menu_items(text, restrictions):
@@ -107,13 +79,8 @@ def analyze_menu_items(text, restrictions):
     # Split text into lines and process
     lines = text.split('\n')
     
-    # Keywords for different restrictions
-    vegan_unsafe = ['meat', 'chicken', 'beef', 'pork', 'fish', 'egg', 'dairy', 'milk', 'cheese', 'butter', 'cream', 'honey']
-    vegetarian_unsafe = ['meat', 'chicken', 'beef', 'pork', 'fish', 'seafood']
-    gluten_unsafe = ['wheat', 'bread', 'pasta', 'flour', 'barley', 'rye', 'soy sauce']
-    dairy_unsafe = ['milk', 'cheese', 'butter', 'cream', 'yogurt', 'paneer']
-    nut_unsafe = ['nut', 'peanut', 'almond', 'cashew', 'walnut', 'pistachio']
-    shellfish_unsafe = ['shrimp', 'crab', 'lobster', 'shellfish', 'prawn']
+    # Compiled keyword patterns, shared across reruns and sessions
+    rules, price_pattern = load_rules()
     
     # Process each line as a potential dish
     for line in lines:
@@ -122,11 +89,11 @@ def analyze_menu_items(text, restrictions):
             continue
             
         # Try to extract price
-        price_match = re.search(r'[\$₹€£]\s*\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\s*[\$₹€£]', line)
+        price_match = price_pattern.search(line)
         price = price_match.group(0) if price_match else 'N/A'
         
         # Remove price from dish name
-        dish_name = re.sub(r'[\$₹€£]\s*\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\s*[\$₹€£]', '', line).strip()
+        dish_name = price_pattern.sub('', line).strip()
         
         if not dish_name:
             continue
@@ -142,7 +109,7 @@ def analyze_menu_items(text, restrictions):
         
         # Check each restriction
         if 'Vegan' in restrictions:
-            if any(keyword in line_lower for keyword in vegan_unsafe):
+            if rules['Vegan'].search(line_lower):
                 is_safe = False
                 unsafe_for.append('Vegan')
                 reasons.append('Contains animal products')
@@ -150,7 +117,7 @@ def analyze_menu_items(text, restrictions):
                 safe_for.append('Vegan')
         
         if 'Vegetarian' in restrictions:
-            if any(keyword in line_lower for keyword in vegetarian_unsafe):
+            if rules['Vegetarian'].search(line_lower):
                 is_safe = False
                 unsafe_for.append('Vegetarian')
                 reasons.append('Contains meat or fish')
@@ -158,7 +125,7 @@ def analyze_menu_items(text, restrictions):
                 safe_for.append('Vegetarian')
         
         if 'Gluten-Free' in restrictions:
-            if any(keyword in line_lower for keyword in gluten_unsafe):
+            if rules['Gluten-Free'].search(line_lower):
                 is_safe = False
                 unsafe_for.append('Gluten-Free')
                 reasons.append('Contains gluten')
@@ -167,7 +134,7 @@ def analyze_menu_items(text, restrictions):
                 warnings.append('Verify no cross-contamination')
         
         if 'Dairy-Free' in restrictions:
-            if any(keyword in line_lower for keyword in dairy_unsafe):
+            if rules['Dairy-Free'].search(line_lower):
                 is_safe = False
                 unsafe_for.append('Dairy-Free')
                 reasons.append('Contains dairy products')
@@ -175,7 +142,7 @@ def analyze_menu_items(text, restrictions):
                 safe_for.append('Dairy-Free')
         
         if 'Nut Allergy' in restrictions:
-            if any(keyword in line_lower for keyword in nut_unsafe):
+            if rules['Nut Allergy'].search(line_lower):
                 is_safe = False
                 unsafe_for.append('Nut Allergy')
                 reasons.append('Contains nuts')
@@ -185,7 +152,7 @@ def analyze_menu_items(text, restrictions):
                 warnings.append('Always verify with restaurant staff')
         
         if 'Shellfish Allergy' in restrictions:
-            if any(keyword in line_lower for keyword in shellfish_unsafe):
+            if rules['Shellfish Allergy'].search(line_lower):
                 is_safe = False
                 unsafe_for.append('Shellfish Allergy')
                 reasons.append('Contains shellfish')
@@ -309,69 +276,146 @@ with st.expander("👁️ See Example - How It Works"):
 col1, col2 = st.columns([1, 1])
 
 with col1:
-    st.subheader("📸 Upload Menu Image")
-    uploaded_file = st.file_uploader(
-        "Choose an image file",
-        type=['jpg', 'jpeg', 'png'],
-        help="Upload a clear photo of the restaurant menu"
+    scan_mode = st.radio(
+        "Input mode",
+        ["📸 Upload Photo", "🎥 Live Camera Scan"],
+        horizontal=True,
+        label_visibility="collapsed"
     )
+
+# Results from one input mode should not show up under the other
+if scan_mode != st.session_state.scan_mode:
+    st.session_state.scan_mode = scan_mode
+    st.session_state.results = None
+    st.session_state.analyzed = False
+    st.session_state.extracted_text = None
+
+if scan_mode == "🎥 Live Camera Scan":
+    uploaded_file = None
     
-    if uploaded_file:
-        image = Image.open(uploaded_file)
-        st.image(image, caption="Uploaded Menu", use_column_width=True)
+    with col1:
+        st.subheader("🎥 Scan Menu with Camera")
+        frame = st.camera_input(
+            "Point your camera at the menu",
+            help="Keep capturing as you move across the menu - results build up as you go"
+        )
+    
+    with col2:
+        st.subheader("🔍 Live Results")
         
-        # Image quality check
-        width, height = image.size
-        if width < 800 or height < 600:
-            st.warning("⚠️ Image resolution is low. OCR results may be less accurate.")
+        if not restrictions:
+            st.warning("👈 Select your dietary restrictions from the sidebar")
+        else:
+            from live_scan import LiveMenuScanner
+            
+            frame_id = frame.file_id if frame else None
+            
+            scanner = st.session_state.scanner
+            if scanner is None or scanner.restrictions != restrictions:
+                # New restrictions: re-analyze the current capture from scratch
+                scanner = LiveMenuScanner(load_ocr_engine().image_to_string, analyze_menu_items, restrictions.copy())
+                st.session_state.scanner = scanner
+                st.session_state.last_frame_id = None
+                st.session_state.results = None
+                st.session_state.analyzed = False
+            
+            if st.button("🔄 Start New Scan"):
+                # The camera keeps returning its last capture, so mark it as seen
+                scanner.reset()
+                st.session_state.last_frame_id = frame_id
+                st.session_state.results = None
+                st.session_state.analyzed = False
+            
+            # Only feed new captures; other widgets rerun with the same one
+            if frame and frame_id != st.session_state.last_frame_id:
+                from PIL import Image
+                
+                try:
+                    if scanner.process_frame(Image.open(frame)):
+                        st.success("✅ New menu area analyzed")
+                    else:
+                        st.info("⏭️ View unchanged - skipped OCR")
+                    st.session_state.last_frame_id = frame_id
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
+                    st.info("💡 Make sure Tesseract is installed correctly.")
+            
+            st.caption(f"Frames analyzed: {scanner.frames_analyzed} / {scanner.frames_seen} · "
+                       f"Dishes found: {len(scanner.dishes)}")
+            
+            if scanner.dishes:
+                st.session_state.results = scanner.results
+                st.session_state.analyzed = True
+            else:
+                st.info("👈 Capture a frame of the menu to get started")
 
-with col2:
-    st.subheader("🔍 Ready to Analyze")
+else:
+    with col1:
+        st.subheader("📸 Upload Menu Image")
+        uploaded_file = st.file_uploader(
+            "Choose an image file",
+            type=['jpg', 'jpeg', 'png'],
+            help="Upload a clear photo of the restaurant menu"
+        )
     
-    if not uploaded_file:
-        st.info("👈 Upload a menu image to get started")
-    elif not restrictions:
-        st.warning("👈 Select your dietary restrictions from the sidebar")
-    else:
-        st.success("✅ Ready to analyze!")
+        if uploaded_file:
+            from PIL import Image
+            
+            image = Image.open(uploaded_file)
+            st.image(image, caption="Uploaded Menu", use_column_width=True)
         
-        if st.button("🚀 Analyze Menu Now", type="primary"):
-            st.session_state.analyzed = False
+            # Image quality check
+            width, height = image.size
+            if width < 800 or height < 600:
+                st.warning("⚠️ Image resolution is low. OCR results may be less accurate.")
+
+    with col2:
+        st.subheader("🔍 Ready to Analyze")
+    
+        if not uploaded_file:
+            st.info("👈 Upload a menu image to get started")
+        elif not restrictions:
+            st.warning("👈 Select your dietary restrictions from the sidebar")
+        else:
+            st.success("✅ Ready to analyze!")
+        
+            if st.button("🚀 Analyze Menu Now", type="primary"):
+                st.session_state.analyzed = False
             
-            with st.spinner(""):
-                st.markdown("""
-                <div style='text-align: center; padding: 2rem;'>
-                    <div style='font-size: 3rem; animation: pulse 1.5s infinite;'>
-                        🔍
+                with st.spinner(""):
+                    st.markdown("""
+                    <div style='text-align: center; padding: 2rem;'>
+                        <div style='font-size: 3rem; animation: pulse 1.5s infinite;'>
+                            🔍
+                        </div>
+                        <h3 style='color: #667eea; margin-top: 1rem;'>
+                            Extracting text from menu...
+                        </h3>
+                        <p style='color: #999;'>Using Tesseract OCR</p>
                     </div>
-                    <h3 style='color: #667eea; margin-top: 1rem;'>
-                        Extracting text from menu...
-                    </h3>
-                    <p style='color: #999;'>Using Tesseract OCR</p>
-                </div>
-                """, unsafe_allow_html=True)
+                    """, unsafe_allow_html=True)
                 
-                try:
-                    # Extract text using Tesseract OCR
-                    extracted_text = pytesseract.image_to_string(image)
-                    st.session_state.extracted_text = extracted_text
+                    try:
+                        # Extract text using Tesseract OCR
+                        extracted_text = load_ocr_engine().image_to_string(image)
+                        st.session_state.extracted_text = extracted_text
                     
-                    if not extracted_text.strip():
-                        st.error("❌ No text detected in image. Please upload a clearer image.")
-                    else:
-                        # Analyze the extracted text
-                        results = analyze_menu_items(extracted_text, restrictions)
-                        
-                        if not results:
-                            st.warning("⚠️ No menu items detected. Try a clearer image.")
+                        if not extracted_text.strip():
+                            st.error("❌ No text detected in image. Please upload a clearer image.")
                         else:
-                            st.session_state.results = results
-                            st.session_state.analyzed = True
-                            st.rerun()
+                            # Analyze the extracted text
+                            results = analyze_menu_items(extracted_text, restrictions)
+                        
+                            if not results:
+                                st.warning("⚠️ No menu items detected. Try a clearer image.")
+                            else:
+                                st.session_state.results = results
+                                st.session_state.analyzed = True
+                                st.rerun()
                     
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
-                    st.info("💡 Make sure Tesseract is installed correctly.")
+                    except Exception as e:
+                        st.error(f"❌ Error: {str(e)}")
+                        st.info("💡 Make sure Tesseract is installed correctly.")
 
 # Display extracted text (for debugging)
 if st.session_state.extracted_text and not st.session_state.analyzed:
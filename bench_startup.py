@@ -0,0 +1,75 @@
+"""
+Startup-time benchmark comparing the old eager App startup with the lazy, cached one.
+
+Each measurement runs in a fresh interpreter so import and detection
+costs are not hidden by an earlier run. Setup code runs before the
+timer starts.
+
+    python bench_startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(ROOT, 'App.py')
+
+OLD_TESSERACT_CMD = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+# (label, setup, timed)
+SNIPPETS = [
+    ("old App imports (eager)", "",
+     "import streamlit, pytesseract\n"
+     "from PIL import Image\n"
+     f"pytesseract.pytesseract.tesseract_cmd = {OLD_TESSERACT_CMD!r}"),
+    ("new App imports (lazy)", "",
+     "import streamlit, resources"),
+    ("App first render", "from streamlit.testing.v1 import AppTest",
+     f"AppTest.from_file({APP!r}, default_timeout=60).run()"),
+    ("first scan resources, cold", "from resources import load_ocr_engine, load_rules",
+     "load_rules(); load_ocr_engine()"),
+    # App.py starts warm-up on a background thread; this is what a scan
+    # arriving right after the first render still waits for
+    ("OCR engine ready after render",
+     f"from streamlit.testing.v1 import AppTest\nAppTest.from_file({APP!r}, default_timeout=60).run()\n"
+     "import resources",
+     "resources.start_warm_up().join(); resources.load_ocr_engine()"),
+    ("App render to OCR engine ready", "from streamlit.testing.v1 import AppTest\nimport resources",
+     f"AppTest.from_file({APP!r}, default_timeout=60).run()\n"
+     "resources.start_warm_up().join(); resources.load_ocr_engine()"),
+    ("warm_up (with OCR)", "from resources import warm_up",
+     "warm_up()"),
+]
+
+
+def time_cold(setup, snippet):
+    code = (
+        "import time\n"
+        f"{setup}\n"
+        "start = time.perf_counter()\n"
+        f"{snippet}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=ROOT)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="repetitions per measurement")
+    args = parser.parse_args()
+
+    print(f"{'step':<32}{'median ms':>12}{'min ms':>12}")
+    for label, setup, snippet in SNIPPETS:
+        try:
+            timings = [time_cold(setup, snippet) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{label:<32}{'failed':>12}  {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{label:<32}{statistics.median(timings) * 1000:>12.3f}{min(timings) * 1000:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+import logging
+import os
+import re
+import shutil
+import threading
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Checked in order when tesseract is not on PATH
+TESSERACT_CANDIDATES = [
+    r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+    r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+    '/opt/homebrew/bin/tesseract',
+    '/usr/local/bin/tesseract',
+    '/usr/bin/tesseract',
+]
+
+# Keywords for different restrictions
+RESTRICTION_KEYWORDS = {
+    'Vegan': ['meat', 'chicken', 'beef', 'pork', 'fish', 'egg', 'dairy', 'milk', 'cheese', 'butter', 'cream', 'honey'],
+    'Vegetarian': ['meat', 'chicken', 'beef', 'pork', 'fish', 'seafood'],
+    'Gluten-Free': ['wheat', 'bread', 'pasta', 'flour', 'barley', 'rye', 'soy sauce'],
+    'Dairy-Free': ['milk', 'cheese', 'butter', 'cream', 'yogurt', 'paneer'],
+    'Nut Allergy': ['nut', 'peanut', 'almond', 'cashew', 'walnut', 'pistachio'],
+    'Shellfish Allergy': ['shrimp', 'crab', 'lobster', 'shellfish', 'prawn'],
+}
+
+PRICE_PATTERN = r'[\$₹€£]\s*\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\s*[\$₹€£]'
+
+
+def find_tesseract_cmd():
+    """
+    Locate the tesseract binary: TESSERACT_CMD env var, then PATH, then common install paths
+    """
+    env_cmd = os.environ.get('TESSERACT_CMD')
+    if env_cmd:
+        return env_cmd
+
+    path_cmd = shutil.which('tesseract')
+    if path_cmd:
+        return path_cmd
+
+    for candidate in TESSERACT_CANDIDATES:
+        if os.path.isfile(candidate):
+            return candidate
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_ocr_engine():
+    """
+    Import pytesseract and point it at the detected binary, once per process
+    """
+    import pytesseract
+
+    tesseract_cmd = find_tesseract_cmd()
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    return pytesseract
+
+
+@lru_cache(maxsize=None)
+def load_rules():
+    """
+    Compile keyword lists into one regex per restriction, plus the price pattern
+    """
+    rules = {
+        restriction: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+        for restriction, keywords in RESTRICTION_KEYWORDS.items()
+    }
+    return rules, re.compile(PRICE_PATTERN)
+
+
+def warm_up(run_ocr=True):
+    """
+    Build all shared resources ahead of the first real request.
+
+    With run_ocr, tesseract is also run once on a tiny blank image so its
+    binary and language data are already loaded when a menu arrives.
+    """
+    try:
+        load_rules()
+        engine = load_ocr_engine()
+
+        if run_ocr:
+            from PIL import Image
+
+            engine.image_to_string(Image.new('L', (64, 32), 255))
+    except Exception:
+        # A missing pytesseract or binary is reported to the user on their first scan
+        logger.debug("Warm-up failed", exc_info=True)
+
+
+@lru_cache(maxsize=None)
+def start_warm_up():
+    """
+    Run warm_up() on a background thread, at most once per process
+    """
+    thread = threading.Thread(target=warm_up, name='menu-filter-warm-up', daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == '__main__':
+    warm_up()
+    print(f"Tesseract: {load_ocr_engine().pytesseract.tesseract_cmd}")
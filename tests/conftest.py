@@ -0,0 +1,46 @@
+import random
+from functools import lru_cache
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+MENU_WORDS = ['chicken', 'curry', 'paneer', 'tikka', 'masala', 'rice', 'naan', 'garlic',
+              'butter', 'lentil', 'soup', 'salad', 'shrimp', 'noodles', 'tofu', 'vegan']
+
+# None spaces lines unevenly; numbers are a fixed line pitch in pixels,
+# the usual printed layout
+MENU_PITCHES = [None, 40, 45, 50, 60]
+
+
+@lru_cache(maxsize=None)
+def render_menu(pitch=None):
+    """
+    A tall synthetic printed menu to crop camera views from
+    """
+    rng = random.Random(1)
+    font = ImageFont.load_default(size=28)
+    page = Image.new('RGB', (1200, 3000), 'white')
+    draw = ImageDraw.Draw(page)
+
+    y = 20
+    while y < 2960:
+        name = ' '.join(rng.choice(MENU_WORDS).title() for _ in range(rng.randint(2, 5)))
+        draw.text((40, y), f"{name}  ${rng.randint(5, 30)}", fill='black', font=font)
+        y += pitch or rng.choice([45, 45, 80])
+    return page
+
+
+@pytest.fixture(params=MENU_PITCHES, ids=lambda pitch: f"pitch-{pitch or 'uneven'}")
+def menu_page(request):
+    return render_menu(request.param)
+
+
+@pytest.fixture
+def camera_view(menu_page):
+    """
+    Crop a 640x480 camera frame from the menu at a vertical offset, with optional sideways shift.
+    Offsets are in menu pixels; the menu is shown at about half scale in the frame
+    """
+    def view(offset, shift=0):
+        return menu_page.crop((shift, offset, shift + 1200, offset + 900)).resize((640, 480))
+    return view
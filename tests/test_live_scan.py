@@ -0,0 +1,137 @@
+import pytest
+from PIL import Image, ImageChops, ImageEnhance, ImageFilter
+
+from live_scan import LiveMenuScanner, iter_video_frames
+
+
+def fake_ocr(image):
+    return "Vegetable Curry $9"
+
+
+def fake_analyze(text, restrictions):
+    return [{'dish_name': 'Vegetable Curry', 'safe': True}]
+
+
+def make_scanner(ocr=fake_ocr):
+    return LiveMenuScanner(ocr, fake_analyze, ['Vegan'])
+
+
+def test_unchanged_frame_is_skipped(camera_view):
+    scanner = make_scanner()
+    assert scanner.process_frame(camera_view(1000))
+    assert not scanner.process_frame(camera_view(1000))
+    assert (scanner.frames_analyzed, scanner.frames_seen) == (1, 2)
+
+
+# Menu pixels; 16 is about 8 px in the camera frame
+@pytest.mark.parametrize('jitter', [1, 3, 6, 10, 16])
+def test_jittered_frame_is_skipped(camera_view, jitter):
+    scanner = make_scanner()
+    scanner.process_frame(camera_view(1000))
+    assert not scanner.process_frame(camera_view(1000 + jitter, shift=jitter))
+
+
+@pytest.mark.parametrize('sigma', [10, 20, 30])
+def test_sensor_noise_is_skipped(camera_view, sigma):
+    frame = camera_view(1000).convert('L')
+    noisy = ImageChops.add(frame, Image.effect_noise(frame.size, sigma), offset=-128)
+
+    scanner = make_scanner()
+    scanner.process_frame(frame)
+    assert not scanner.process_frame(noisy)
+
+
+@pytest.mark.parametrize('radius', [1, 2])
+def test_focus_blur_is_skipped(camera_view, radius):
+    scanner = make_scanner()
+    scanner.process_frame(camera_view(1000))
+    assert not scanner.process_frame(camera_view(1000).filter(ImageFilter.GaussianBlur(radius)))
+
+
+@pytest.mark.parametrize('brightness', [0.7, 1.3])
+def test_exposure_shift_is_skipped(camera_view, brightness):
+    scanner = make_scanner()
+    scanner.process_frame(camera_view(1000))
+    assert not scanner.process_frame(ImageEnhance.Brightness(camera_view(1000)).enhance(brightness))
+
+
+# From a single line on the tightest pitch up to a view with no overlap
+@pytest.mark.parametrize('offset', [40, 45, 90, 200, 450, 900])
+def test_pan_to_new_content_triggers_ocr(camera_view, offset):
+    scanner = make_scanner()
+    scanner.process_frame(camera_view(1000))
+    assert scanner.process_frame(camera_view(1000 + offset))
+
+
+def test_pan_replay_analyzes_each_new_region(camera_view):
+    scanner = make_scanner()
+    for offset in range(0, 2100, 100):
+        scanner.process_frame(camera_view(offset))
+    assert scanner.frames_seen == 21
+    assert scanner.frames_analyzed == 21
+
+
+def test_replay_of_separate_views_analyzes_each(camera_view):
+    scanner = make_scanner()
+    for offset in range(0, 2100, 300):
+        scanner.process_frame(camera_view(offset))
+    assert (scanner.frames_analyzed, scanner.frames_seen) == (7, 7)
+
+
+def test_failed_ocr_is_retried(camera_view):
+    def broken_ocr(image):
+        raise RuntimeError("tesseract is not installed")
+
+    scanner = make_scanner(ocr=broken_ocr)
+    with pytest.raises(RuntimeError):
+        scanner.process_frame(camera_view(1000))
+
+    scanner.ocr = fake_ocr
+    assert scanner.process_frame(camera_view(1000))
+    assert scanner.frames_analyzed == 1
+
+
+def test_merge_keeps_first_seen_order_and_latest_verdict():
+    scanner = make_scanner()
+    scanner.merge([{'dish_name': 'Pad Thai', 'safe': True}, {'dish_name': 'Green Curry', 'safe': True}])
+    scanner.merge([{'dish_name': 'pad  thai', 'safe': False}, {'dish_name': 'Spring Rolls', 'safe': True}])
+
+    assert [dish['dish_name'] for dish in scanner.results] == ['pad  thai', 'Green Curry', 'Spring Rolls']
+    assert scanner.results[0]['safe'] is False
+
+
+def test_reset_clears_scan(camera_view):
+    scanner = make_scanner()
+    scanner.process_frame(camera_view(1000))
+    scanner.reset()
+
+    assert scanner.results == []
+    assert (scanner.frames_analyzed, scanner.frames_seen) == (0, 0)
+    assert scanner.process_frame(camera_view(1000))
+
+
+def test_iter_video_frames_replays_clip(tmp_path, camera_view):
+    cv2 = pytest.importorskip('cv2')
+    np = pytest.importorskip('numpy')
+
+    path = str(tmp_path / 'pan.avi')
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (640, 480))
+    offsets = [1000] * 5 + [1300] * 5 + [1600] * 5
+    for offset in offsets:
+        writer.write(cv2.cvtColor(np.asarray(camera_view(offset)), cv2.COLOR_RGB2BGR))
+    writer.release()
+
+    frames = list(iter_video_frames(path))
+    assert len(frames) == len(offsets)
+    assert all(isinstance(frame, Image.Image) and frame.size == (640, 480) for frame in frames)
+    assert len(list(iter_video_frames(path, step=4))) == 4
+
+    scanner = make_scanner()
+    for frame in frames:
+        scanner.process_frame(frame)
+    assert (scanner.frames_analyzed, scanner.frames_seen) == (3, 15)
+
+
+def test_iter_video_frames_rejects_bad_step():
+    with pytest.raises(ValueError):
+        next(iter_video_frames('missing.avi', step=0))
@@ -0,0 +1,109 @@
+import itertools
+
+import pytest
+
+import resources
+from resources import PRICE_PATTERN, RESTRICTION_KEYWORDS, TESSERACT_CANDIDATES, find_tesseract_cmd, load_rules
+
+ALL_KEYWORDS = sorted({keyword for keywords in RESTRICTION_KEYWORDS.values() for keyword in keywords})
+
+MENU_LINES = [
+    'pad thai with peanuts $12.50',
+    'nutmeg spiced pumpkin soup',
+    'tofu stir fry with soy sauce',
+    'edamame with soy  sauce',
+    'sauce of the day, soy glaze',
+    'coconut curry',
+    'eggplant parmesan',
+    'buttermilk pancakes',
+    'crabcakes',
+    'shellfishless broth',
+    'rye whiskey glaze',
+    'honeydew melon',
+    'creamy mushroom risotto',
+    'grilled seafood platter',
+    'garden salad',
+    '',
+]
+
+
+def old_match(keywords, line):
+    return any(keyword in line for keyword in keywords)
+
+
+def sample_lines():
+    yield from MENU_LINES
+    yield from ALL_KEYWORDS
+    for keyword in ALL_KEYWORDS:
+        yield f"house {keyword}s special"
+        yield f"un{keyword}ed"
+    for first, second in itertools.combinations(['soy', 'sauce', 'nut', 'pea', 'butter', 'milk'], 2):
+        yield f"{first} {second}"
+        yield f"{first}{second}"
+
+
+@pytest.mark.parametrize('restriction', sorted(RESTRICTION_KEYWORDS))
+def test_rules_match_old_substring_check(restriction):
+    rules, _ = load_rules()
+    keywords = RESTRICTION_KEYWORDS[restriction]
+    for line in sample_lines():
+        assert bool(rules[restriction].search(line)) == old_match(keywords, line), line
+
+
+def test_rules_cover_multi_word_and_embedded_keywords():
+    rules, _ = load_rules()
+    assert rules['Gluten-Free'].search('tofu with soy sauce')
+    assert not rules['Gluten-Free'].search('soy glaze with a sauce')
+    assert rules['Nut Allergy'].search('peanut noodles')
+    assert rules['Nut Allergy'].search('nutmeg custard')
+
+
+@pytest.mark.parametrize('line, price, dish', [
+    ('Pad Thai $12.50', '$12.50', 'Pad Thai'),
+    ('Paneer Tikka ₹ 250', '₹ 250', 'Paneer Tikka'),
+    ('Croque Monsieur 9.50€', '9.50€', 'Croque Monsieur'),
+    ('£7 Fish and Chips', '£7', 'Fish and Chips'),
+    ('Garden Salad', None, 'Garden Salad'),
+])
+def test_price_pattern(line, price, dish):
+    _, price_pattern = load_rules()
+    match = price_pattern.search(line)
+    assert (match.group(0) if match else None) == price
+    assert price_pattern.sub('', line).strip() == dish
+    assert price_pattern.pattern == PRICE_PATTERN
+
+
+@pytest.fixture
+def no_tesseract(monkeypatch):
+    monkeypatch.delenv('TESSERACT_CMD', raising=False)
+    monkeypatch.setattr(resources.shutil, 'which', lambda name: None)
+    monkeypatch.setattr(resources.os.path, 'isfile', lambda path: False)
+    return monkeypatch
+
+
+def test_find_tesseract_prefers_env_var(no_tesseract):
+    no_tesseract.setenv('TESSERACT_CMD', '/custom/tesseract')
+    no_tesseract.setattr(resources.shutil, 'which', lambda name: '/usr/bin/tesseract')
+    no_tesseract.setattr(resources.os.path, 'isfile', lambda path: True)
+    assert find_tesseract_cmd() == '/custom/tesseract'
+
+
+def test_find_tesseract_then_path(no_tesseract):
+    no_tesseract.setattr(resources.shutil, 'which', lambda name: '/path/bin/tesseract')
+    no_tesseract.setattr(resources.os.path, 'isfile', lambda path: True)
+    assert find_tesseract_cmd() == '/path/bin/tesseract'
+
+
+@pytest.mark.parametrize('candidate', TESSERACT_CANDIDATES)
+def test_find_tesseract_then_install_paths(no_tesseract, candidate):
+    no_tesseract.setattr(resources.os.path, 'isfile', lambda path: path == candidate)
+    assert find_tesseract_cmd() == candidate
+
+
+def test_find_tesseract_falls_back_in_order(no_tesseract):
+    no_tesseract.setattr(resources.os.path, 'isfile', lambda path: True)
+    assert find_tesseract_cmd() == TESSERACT_CANDIDATES[0]
+
+
+def test_find_tesseract_not_found(no_tesseract):
+    assert find_tesseract_cmd() is None